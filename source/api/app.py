@@ -878,8 +878,11 @@ def log_request_parameters():
 def validate_amc_request():
     try:
         redirect_uri = tasks.get_redirect_uri(app.current_request)
+        # Always check the stored refresh token against Login with Amazon.
         return tasks.get_ads_token(
-            **app.current_request.json_body, redirect_uri=redirect_uri
+            **app.current_request.json_body,
+            redirect_uri=redirect_uri,
+            use_cache=False,
         )
     except Exception as ex:
         logger.error(ex)
@@ -3,7 +3,12 @@
 
 import json
 import logging
-from urllib.request import HTTPHandler, Request, build_opener
+
+import urllib3
+
+# Reuse one connection pool across warm invocations instead of opening a new
+# connection for every response. urllib3 ships with botocore in the Lambda runtime.
+http = urllib3.PoolManager()
 
 
 def send_response(event, context, response_status, response_data) -> None:
@@ -21,18 +26,19 @@ def send_response(event, context, response_status, response_data) -> None:
             "RequestId": event["RequestId"],
             "LogicalResourceId": event["LogicalResourceId"],
             "Data": response_data,
-        }
+        },
+        separators=(",", ":"),
     )
 
-    logger.info(f"ResponseURL: {event['ResponseURL']}")
-    logger.info(f"ResponseBody: {response_body}")
-    opener = build_opener(HTTPHandler)
-    request = Request(event["ResponseURL"], data=response_body.encode("utf-8"))
-    request.add_header("Content-Type", "")
-    request.add_header("Content-Length", str(len(response_body)))
-    # Ensure that the HTTP method can be determined at runtime, just before the request is executed
-    # by setting get_method to a callable (like a lambda function).
-    request.get_method = lambda: "PUT"
-    response = opener.open(request)
-    logger.info(f"Status code: {response.getcode}")
-    logger.info(f"Status message: {response.msg}")
+    logger.info("ResponseURL: %s", event["ResponseURL"])
+    logger.info("ResponseBody: %s", response_body)
+    body = response_body.encode("utf-8")
+    response = http.request(
+        "PUT",
+        event["ResponseURL"],
+        body=body,
+        headers={"Content-Type": "", "Content-Length": str(len(body))},
+        timeout=10,
+    )
+    logger.info("Status code: %s", response.status)
+    logger.info("Status message: %s", response.reason)
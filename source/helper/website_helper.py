@@ -11,15 +11,38 @@ PURPOSE:
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import boto3
+from botocore.config import Config
 from cf_helper import send_response
+from config_helper import WEB_RUNTIME_CONFIG
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-s3 = boto3.resource("s3")
-s3_client = boto3.client("s3")
+# Website files are small, so copies are bound by S3 round-trips rather than
+# bandwidth. Run them concurrently, with a connection available per worker.
+MAX_COPY_WORKERS = 16
+
+s3_client = boto3.client(
+    "s3", config=Config(max_pool_connections=MAX_COPY_WORKERS)
+)
+
+
+@lru_cache(maxsize=None)
+def load_manifest():
+    """
+    Returns the website file paths listed in `webapp-manifest.json`.
+
+    The manifest is packaged with the function and never changes, so it is parsed
+    once per Lambda container and reused by warm invocations.
+    """
+    with open("./webapp-manifest.json", encoding="utf-8") as file:
+        # The runtime config in the build output is an empty placeholder which
+        # config_helper overwrites, so copying it would be a wasted request.
+        return tuple(key for key in json.load(file) if key != WEB_RUNTIME_CONFIG)
 
 
 def copy_source(event):
@@ -36,6 +59,7 @@ def copy_source(event):
     - The deployment bucket name is derived by stripping the domain part from the `DeploymentBucket` value.
     - It assumes that the `webapp-manifest.json` file is present in the root directory where the function is executed
       and contains a JSON object with keys representing the file paths to be copied.
+    - `runtimeConfig.json` is skipped because it is written by `config_helper`.
     """
 
     source_bucket = event["ResourceProperties"]["WebsiteCodeBucket"]
@@ -45,16 +69,20 @@ def copy_source(event):
         "."
     )[0]
 
-    with open("./webapp-manifest.json", encoding="utf-8") as file:
-        manifest = json.load(file)
-        logger.info("UPLOADING FILES:")
-        for key in manifest:
-            logger.info(f"s3://{source_bucket}/{source_key}/{key}")
-            s3.meta.client.copy(
-                {"Bucket": source_bucket, "Key": f"{source_key}/{key}"},
-                website_bucket,
-                key,
-            )
+    def copy_file(key):
+        logger.info("s3://%s/%s/%s", source_bucket, source_key, key)
+        # A single server-side CopyObject call avoids the transfer manager's
+        # multipart setup, which only pays off for large objects.
+        s3_client.copy_object(
+            Bucket=website_bucket,
+            Key=key,
+            CopySource={"Bucket": source_bucket, "Key": f"{source_key}/{key}"},
+        )
+
+    logger.info("UPLOADING FILES:")
+    with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+        # Consume the results so that a failed copy raises here.
+        list(executor.map(copy_file, load_manifest()))
 
 
 def lambda_handler(event, context):
@@ -73,8 +101,8 @@ def lambda_handler(event, context):
     """
     try:
         # Log the received event and context for debugging.
-        logger.info(f"REQUEST RECEIVED:\n {event}")
-        logger.info(f"CONTEXT RECEIVED:\n {context}")
+        logger.info("REQUEST RECEIVED:\n %s", event)
+        logger.info("CONTEXT RECEIVED:\n %s", context)
 
         # Determine the request type from the event and call the appropriate function.
         request_type = event["RequestType"]
@@ -11,11 +11,14 @@
 #
 ##########################################################################
 
+import http.cookiejar
 import json
 import logging
 import os
+import threading
+import time
 import urllib.parse
-from functools import wraps
+from functools import lru_cache, wraps
 from chalice import Response
 import boto3
 import requests
@@ -48,6 +51,37 @@ config = config.Config(**solution_config)
 NO_ACCESS_KEY_ERROR = "No access key is available."
 DELETE_STRING = "TOKEN_DELETED"
 ADS_SCOPE = "profile%20advertising::campaign_management"
+# Refresh cached access tokens this many seconds before they expire.
+ADS_TOKEN_EXPIRY_BUFFER = 60
+
+# Access tokens obtained from a refresh token, keyed by (client_id, refresh_token).
+# Warm Lambda containers reuse these instead of calling the token endpoint
+# for every AMC request.
+_ADS_TOKEN_CACHE = {}
+_ADS_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+# Share one session across requests so that warm Lambda invocations reuse
+# pooled TCP/TLS connections instead of opening a new one per request.
+# Retry requests that receive server error (5xx) or throttling errors 429.
+MAX_RETRY = 10
+session_request = requests.Session()
+# The session is shared by every user's requests, so never persist cookies.
+session_request.cookies.set_policy(
+    http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+)
+session_request.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=MAX_RETRY,
+            backoff_factor=0.5,
+            status_forcelist=[504, 500, 429],
+            allowed_methods=frozenset(["GET", "DELETE", "POST", "PUT"]),
+        ),
+    ),
+)
 
 
 def safe_json_loads(obj):
@@ -60,47 +94,44 @@ def safe_json_loads(obj):
 def send_request(
     request_url, headers, http_method, data=None, params=None
 ):
-    logger.info("\nBEGIN REQUEST+++++++++++++++++++++++++++++++++++")
-    logger.info(f"Request URL = {request_url}")
-    logger.info(f"HTTP_METHOD: {http_method}")
-
-    # Retry requests that receive server error (5xx) or throttling errors 429.
-    with (requests.Session() as session_request):
-        max_retry = 10
-        retries = Retry(
-            total=max_retry,
-            backoff_factor=0.5,
-            status_forcelist=[504, 500, 429],
-            allowed_methods=frozenset(["GET", "DELETE", "POST", "PUT"]),
-        )
-        session_request.mount("https://", HTTPAdapter(max_retries=retries))
-        logger.info(f"Retry: {max_retry}")
+    logger.debug("\nBEGIN REQUEST+++++++++++++++++++++++++++++++++++")
+    logger.debug("Request URL = %s", request_url)
+    logger.debug("HTTP_METHOD: %s", http_method)
+    logger.debug("Retry: %s", MAX_RETRY)
+
+    response = session_request.request(
+        method=http_method,
+        url=request_url,
+        headers=headers,
+        data=data,
+        params=params
+    )
 
-        response = session_request.request(
-            method=http_method,
-            url=request_url,
-            headers=headers,
-            data=data,
-            params=params
-        )
+    logger.debug("\nRESPONSE+++++++++++++++++++++++++++++++++++")
+    logger.info("Response code: %s\n", response.status_code)
+    # Avoid decoding the response body unless debug logging is enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response body: %s\n", response.text)
+    return response
 
-        logger.info("\nRESPONSE+++++++++++++++++++++++++++++++++++")
-        logger.info(f"Response code: {response.status_code}\n")
-        logger.info(f"Response keys: {response.json().keys()}\n")
-        return response
+
+@lru_cache(maxsize=None)
+def get_secrets_manager_client():
+    # Building a client loads the service model and resolves endpoints, so
+    # create it once per container rather than on every AMC request.
+    session = boto3.session.Session(region_name=os.environ["AWS_REGION"])
+    return session.client(service_name="secretsmanager", config=config)
 
 
 def create_update_secret(secret_id, secret_string):
-    session = boto3.session.Session(region_name=os.environ["AWS_REGION"])
-    client = session.client(service_name="secretsmanager", config=config)
+    client = get_secrets_manager_client()
     if isinstance(secret_string, dict):
         secret_string = json.dumps(secret_string)
     client.update_secret(SecretId=secret_id, SecretString=secret_string)
 
 
 def get_secret(secret_id):
-    session = boto3.session.Session(region_name=os.environ["AWS_REGION"])
-    client = session.client(service_name="secretsmanager", config=config)
+    client = get_secrets_manager_client()
     res = client.get_secret_value(
         SecretId=secret_id,
     )
@@ -120,6 +151,40 @@ def format_client_secret_id(user_id):
     return f"{os.environ['STACK_NAME']}-{user_id}"
 
 
+def get_cached_ads_token(client_id, refresh_token):
+    with _ADS_TOKEN_CACHE_LOCK:
+        cached = _ADS_TOKEN_CACHE.get((client_id, refresh_token))
+        if cached is None:
+            return None
+        if time.time() >= cached["expiry"] - ADS_TOKEN_EXPIRY_BUFFER:
+            del _ADS_TOKEN_CACHE[(client_id, refresh_token)]
+            return None
+        return dict(cached["token"])
+
+
+def cache_ads_token(client_id, refresh_token, token):
+    # Only tokens with a known lifetime can be reused safely.
+    if "expires_in" not in token:
+        return
+    with _ADS_TOKEN_CACHE_LOCK:
+        _ADS_TOKEN_CACHE[(client_id, refresh_token)] = {
+            "expiry": time.time() + int(token["expires_in"]),
+            "token": dict(token),
+        }
+
+
+def invalidate_ads_token(access_token):
+    # Drop every cached entry holding an access token that AMC has rejected,
+    # for example after the user deauthorized the application.
+    with _ADS_TOKEN_CACHE_LOCK:
+        for key in [
+            key
+            for key, cached in _ADS_TOKEN_CACHE.items()
+            if cached["token"].get("access_token") == access_token
+        ]:
+            del _ADS_TOKEN_CACHE[key]
+
+
 def get_ads_token(**kwargs):
     #
     # This function is used to add oAuth authentication to a wrapped function.
@@ -137,6 +202,7 @@ def get_ads_token(**kwargs):
     #   - Saves client_id, client_secret, and refresh_token to Secrets Manager if
     #     auth_code is present and returns dict containing client_id and
     #     refresh_token.
+    #   - Reuses a cached access token unless use_cache=False is passed.
     #
     user_id = kwargs.get("user_id")
     secret_key = format_client_secret_id(user_id)
@@ -164,6 +230,10 @@ def get_ads_token(**kwargs):
             }
 
         refresh_token = secrets["refresh_token"]
+        if kwargs.get("use_cache", True):
+            cached_token = get_cached_ads_token(client_id, refresh_token)
+            if cached_token:
+                return cached_token
         code_payload = {
             "grant_type": "refresh_token",
             "refresh_token": refresh_token,
@@ -195,7 +265,10 @@ def get_ads_token(**kwargs):
         }
         create_update_secret(secret_key, secret_value)
 
-    return {"client_id": client_id, "status_code": response.status_code, **response.json()}
+    token = {"client_id": client_id, "status_code": response.status_code, **response.json()}
+    if response.status_code == 200 and not auth_code:
+        cache_ads_token(client_id, refresh_token, token)
+    return token
 
 
 def get_redirect_uri(current_request):
@@ -285,13 +358,16 @@ class AMCRequests:
         logger.debug(f"AMC_REQUEST_PAYLOAD: {self.payload}")
         logger.debug(f"AMC_HTTP_METHOD: {self.http_method}")
 
-        return send_request(
+        response = send_request(
             request_url=base_url,
             headers=headers,
             http_method=self.http_method,
             data=self.payload,
             params=self.request_parameters,
         )
+        if response.status_code == 401:
+            invalidate_ads_token(kwargs["access_token"])
+        return response
 
 
 def apply_amc_bucket_permission():
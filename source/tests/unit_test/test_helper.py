@@ -88,7 +88,7 @@ def mock_env_variables(test_configs):
 
 
 @mock_aws
-@patch("urllib.request.build_opener")
+@patch("cf_helper.http.request")
 def test_send_response(mock_response, fake_event, fake_context, test_configs):
     from helper.website_helper import send_response
 
@@ -98,10 +98,12 @@ def test_send_response(mock_response, fake_event, fake_context, test_configs):
         response_status=test_configs["response_status"],
         response_data={},
     )
+    mock_response.assert_called_once()
+    assert mock_response.call_args.args == ("PUT", fake_event["ResponseURL"])
 
 
 @mock_aws
-@patch("urllib.request.build_opener")
+@patch("cf_helper.http.request")
 def test_copy_source(mock_response, mock_env_variables, fake_event, fake_context, test_configs):
     s3 = boto3.client("s3", region_name="us-east-1")
     s3.create_bucket(Bucket=test_configs["s3_bucket"])
@@ -114,17 +116,23 @@ def test_copy_source(mock_response, mock_env_variables, fake_event, fake_context
     file_loc = "./webapp-manifest.json"
     from helper.website_helper import lambda_handler
 
-    manifest_data = [test_configs["s3_key"]]
+    # runtimeConfig.json is absent from the source bucket, so copying it would fail.
+    manifest_data = [test_configs["s3_key"], "runtimeConfig.json"]
 
     with patch(
         "builtins.open", mock_open(read_data=json.dumps(manifest_data))
     ) as mock_file:
-        from helper.website_helper import copy_source
+        from helper.website_helper import copy_source, load_manifest
+        load_manifest.cache_clear()
         copy_source(event=fake_event)
         mock_file.assert_called_with(file_loc, encoding="utf-8")
 
+    s3.meta.client.head_object(
+        Bucket=test_configs["s3_bucket"], Key=test_configs["s3_key"]
+    )
+
 
-@patch("urllib.request.build_opener")
+@patch("cf_helper.http.request")
 def test_lambda_handler(mock_response, fake_event, fake_context, test_configs):
     with mock_aws():
         s3 = boto3.client("s3", region_name="us-east-1")
@@ -140,6 +148,9 @@ def test_lambda_handler(mock_response, fake_event, fake_context, test_configs):
 
         manifest_data = [test_configs["s3_key"]]
 
+        from helper.website_helper import load_manifest
+        load_manifest.cache_clear()
+
         with patch(
             "builtins.open", mock_open(read_data=json.dumps(manifest_data))
         ) as mock_file:
@@ -149,12 +160,13 @@ def test_lambda_handler(mock_response, fake_event, fake_context, test_configs):
             fake_event["RequestType"] = "Update"
             lambda_handler(event=fake_event, context=fake_context)
 
-        mock_file.assert_called_with(file_loc, encoding="utf-8")
+        # The manifest is parsed once and reused by later invocations.
+        mock_file.assert_called_once_with(file_loc, encoding="utf-8")
         fake_event["RequestType"] = "Delete"
         lambda_handler(event=fake_event, context=fake_context)
 
 
-@patch("urllib.request.build_opener")
+@patch("cf_helper.http.request")
 def test_config_lambda_handler(mock_response, fake_config_event, fake_context, test_configs):
     with mock_aws():
         s3 = boto3.client("s3", region_name="us-east-1")
@@ -11,6 +11,7 @@
 
 import json
 import os
+from unittest.mock import MagicMock, patch
 
 import pytest
 from moto import mock_aws
@@ -47,3 +48,75 @@ def test_get_client_id_secret_env():
     # Reapply env client_id and secrets.
     os.environ["CLIENT_ID"] = client_id
     os.environ["CLIENT_SECRET"] = client_secret
+
+
+@pytest.fixture
+def clear_ads_token_cache():
+    from share.tasks import _ADS_TOKEN_CACHE
+
+    _ADS_TOKEN_CACHE.clear()
+    yield
+    _ADS_TOKEN_CACHE.clear()
+
+
+def test_ads_token_cache(clear_ads_token_cache):
+    from share.tasks import (
+        ADS_TOKEN_EXPIRY_BUFFER,
+        cache_ads_token,
+        get_cached_ads_token,
+        invalidate_ads_token,
+    )
+
+    token = {"client_id": "client", "access_token": "abc", "expires_in": 3600}
+    cache_ads_token("client", "refresh", token)
+    assert get_cached_ads_token("client", "refresh") == token
+    assert get_cached_ads_token("client", "other_refresh") is None
+
+    # Tokens rejected by AMC are dropped from the cache.
+    invalidate_ads_token("abc")
+    assert get_cached_ads_token("client", "refresh") is None
+
+    # Tokens close to expiry are not reused.
+    cache_ads_token("client", "refresh", {**token, "expires_in": ADS_TOKEN_EXPIRY_BUFFER})
+    assert get_cached_ads_token("client", "refresh") is None
+
+    # Tokens without a lifetime are never cached.
+    cache_ads_token("client", "no_expiry", {"access_token": "abc"})
+    assert get_cached_ads_token("client", "no_expiry") is None
+
+
+def test_get_ads_token_uses_cache(clear_ads_token_cache):
+    from share.tasks import get_ads_token
+
+    secrets = {
+        "client_id": "client",
+        "client_secret": "secret",
+        "refresh_token": "refresh",
+    }
+    token_response = MagicMock(status_code=200)
+    token_response.json.return_value = {
+        "access_token": "abc",
+        "expires_in": 3600,
+    }
+
+    with patch("share.tasks.get_secret", return_value=secrets), patch(
+        "share.tasks.send_request", return_value=token_response
+    ) as mock_send_request:
+        token = get_ads_token(user_id="user", redirect_uri="https://redirect")
+        assert token["access_token"] == "abc"
+        assert mock_send_request.call_count == 1
+
+        # A second call is served from the cache.
+        assert get_ads_token(user_id="user", redirect_uri="https://redirect") == token
+        assert mock_send_request.call_count == 1
+
+        # Validation bypasses the cache.
+        get_ads_token(user_id="user", redirect_uri="https://redirect", use_cache=False)
+        assert mock_send_request.call_count == 2
+
+        # The auth code grant always calls the token endpoint.
+        get_ads_token(
+            user_id="user", redirect_uri="https://redirect", auth_code="code"
+        )
+        assert mock_send_request.call_count == 3
+        assert mock_send_request.call_args.kwargs["data"]["grant_type"] == "authorization_code"